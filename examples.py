@@ -8,11 +8,22 @@ Using MQTT protocol (Mosquitto broker simulation)
 from osi_simulator import OSISimulator
 
 
+# Separator line used between examples
+_EQ80 = "=" * 80
+
+# Title box printed by main(); the inner width is 78 (15 + 44 + 19)
+_BANNER = "\n".join([
+    "╔" + "=" * 78 + "╗",
+    "║" + " " * 15 + "OSI MODEL SIMULATOR - MQTT PROTOCOL EXAMPLES" + " " * 19 + "║",
+    "╚" + "=" * 78 + "╝"
+])
+
+
 def example_basic_usage():
     """Basic usage example"""
-    print("="*80)
+    print(_EQ80)
     print("EXAMPLE 1: Basic Usage")
-    print("="*80)
+    print(_EQ80)
     
     # Create simulator
     simulator = OSISimulator()
@@ -27,9 +38,9 @@ def example_basic_usage():
     decapsulated = simulator.decapsulate(encapsulated)
     
     # Verify
-    print("\n" + "="*80)
+    print("\n" + _EQ80)
     print("RESULT")
-    print("="*80)
+    print(_EQ80)
     print(f"Original:      {message}")
     print(f"Decapsulated:  {decapsulated}")
     print(f"Success:       {message == decapsulated}")
@@ -37,9 +48,9 @@ def example_basic_usage():
 
 def example_layer_details():
     """Example showing detailed layer information"""
-    print("\n\n" + "="*80)
+    print("\n\n" + _EQ80)
     print("EXAMPLE 2: Accessing Layer Details")
-    print("="*80)
+    print(_EQ80)
     
     from osi_simulator import (
         ApplicationLayer, PresentationLayer, SessionLayer,
@@ -66,9 +77,9 @@ def example_layer_details():
 
 def example_custom_message():
     """Example with custom messages"""
-    print("\n\n" + "="*80)
+    print("\n\n" + _EQ80)
     print("EXAMPLE 3: Multiple MQTT Messages")
-    print("="*80)
+    print(_EQ80)
     
     messages = [
         "Temperature: 23.5C",
@@ -77,25 +88,18 @@ def example_custom_message():
         "Simulating a longer MQTT message that will be split into multiple segments during transport!"
     ]
     
+    # One simulator handles every message; encapsulate() draws a fresh
+    # session ID for each run. Printing and step recording are off since
+    # only the final statistics are shown.
+    simulator = OSISimulator(verbose=False, record_steps=False)
+    
     for i, message in enumerate(messages, 1):
-        simulator = OSISimulator()
-        
         print(f"\n--- Message {i}: '{message[:30]}{'...' if len(message) > 30 else ''}' ---")
         
         # Quick test without full output
-        import sys
-        import io
-        
-        # Suppress output temporarily
-        old_stdout = sys.stdout
-        sys.stdout = io.StringIO()
-        
         encapsulated = simulator.encapsulate(message)
         decapsulated = simulator.decapsulate(encapsulated)
         
-        # Restore output
-        sys.stdout = old_stdout
-        
         # Calculate some statistics
         if 'binary_frames' in encapsulated:
             total_bits = encapsulated['total_bits']
@@ -108,18 +112,16 @@ def example_custom_message():
 def main():
     """Run all examples"""
     print("\n")
-    print("╔" + "="*78 + "╗")
-    print("║" + " "*15 + "OSI MODEL SIMULATOR - MQTT PROTOCOL EXAMPLES" + " "*19 + "║")
-    print("╚" + "="*78 + "╝")
+    print(_BANNER)
     
     # Run examples
     example_basic_usage()
     example_layer_details()
     example_custom_message()
     
-    print("\n\n" + "="*80)
+    print("\n\n" + _EQ80)
     print("All examples completed successfully!")
-    print("="*80)
+    print(_EQ80)
 
 
 if __name__ == "__main__":
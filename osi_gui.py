@@ -8,8 +8,25 @@ Using MQTT protocol (Mosquitto broker simulation)
 import tkinter as tk
 from tkinter import scrolledtext, messagebox, ttk
 import threading
-import time
-from osi_simulator import OSISimulator
+import queue
+from osi_simulator import OSISimulator, hex_preview
+
+
+# Previous runs stay in the output tabs; only the oldest lines beyond
+# this limit are dropped
+MAX_OUTPUT_LINES = 5000
+
+# Messages at least this long are simulated in a worker thread; shorter
+# ones finish faster than a thread can be started, so they run inline
+THREADED_MESSAGE_LENGTH = 256
+
+# How often the main thread drains widget updates queued by the simulation (ms)
+OUTPUT_POLL_INTERVAL = 50
+
+# Separator lines used in the output tabs
+_EQ80 = "=" * 80
+_DASH80 = "-" * 80
+_HASH80 = "#" * 80
 
 
 class OSISimulatorGUI:
@@ -23,8 +40,12 @@ class OSISimulatorGUI:
         # Create simulator instance
         self.simulator = OSISimulator()
         
+        # Widget updates from the simulation, applied by the main thread
+        self._output_queue = queue.Queue()
+        
         # Setup GUI
         self.setup_gui()
+        self._poll_output()
     
     def setup_gui(self):
         """Setup the GUI layout"""
@@ -105,6 +126,12 @@ class OSISimulatorGUI:
         self.viz_canvas = tk.Canvas(self.viz_frame, bg="white")
         self.viz_canvas.pack(fill=tk.BOTH, expand=True)
         
+        # The layer diagram does not depend on the message, so draw it once
+        # and only reposition the items when the canvas is resized
+        self.viz_canvas.update_idletasks()
+        self._build_static_viz()
+        self.viz_canvas.bind("<Configure>", self._relayout_viz)
+        
         # Status bar
         self.status_label = tk.Label(
             self.root,
@@ -129,53 +156,121 @@ class OSISimulatorGUI:
         self.simulate_btn.config(state=tk.DISABLED)
         self.status_label.config(text="Simulating...")
         
-        # Run simulation in thread to keep GUI responsive
-        thread = threading.Thread(target=self._simulate, args=(message,))
-        thread.start()
+        # Encapsulate now; decapsulation is scheduled on the Tk event loop
+        self._run_step(message, self._simulate_encap, message)
+    
+    def _run_step(self, message, step, *args):
+        """Run a simulation step inline, or in a worker thread for long messages"""
+        if len(message) < THREADED_MESSAGE_LENGTH:
+            step(*args)
+        else:
+            threading.Thread(target=step, args=args, daemon=True).start()
     
-    def _simulate(self, message):
-        """Internal simulation method"""
+    def _simulate_encap(self, message):
+        """Encapsulation half of the simulation
+        Widget updates are queued for the main thread so this never makes a
+        Tk call; decapsulation is scheduled to start 500 ms later without
+        blocking.
+        """
         try:
-            # Clear previous output
-            self.encap_text.delete(1.0, tk.END)
-            self.decap_text.delete(1.0, tk.END)
+            # Separate from the previous run instead of clearing it
+            self._post(self._start_new_run)
             
             # Encapsulation
-            self.encap_text.insert(tk.END, "="*80 + "\n")
-            self.encap_text.insert(tk.END, "ENCAPSULATION PROCESS (Application → Physical)\n")
-            self.encap_text.insert(tk.END, "="*80 + "\n\n")
+            self._post_text(
+                self.encap_text,
+                _EQ80 + "\n" +
+                "ENCAPSULATION PROCESS (Application → Physical)\n" +
+                _EQ80 + "\n\n"
+            )
             
             encapsulated_data = self._encapsulate_with_display(message)
             
-            # Small delay for visualization
-            time.sleep(0.5)
-            
+        except Exception as e:
+            self._fail_simulation(e)
+            return
+        
+        # Small delay for visualization, scheduled by the main thread
+        self._post(
+            self.root.after,
+            500, self._run_step, message, self._simulate_decap, message, encapsulated_data
+        )
+    
+    def _simulate_decap(self, message, encapsulated_data):
+        """Decapsulation half of the simulation, followed by verification"""
+        try:
             # Decapsulation
-            self.decap_text.insert(tk.END, "="*80 + "\n")
-            self.decap_text.insert(tk.END, "DECAPSULATION PROCESS (Physical → Application)\n")
-            self.decap_text.insert(tk.END, "="*80 + "\n\n")
+            self._post_text(
+                self.decap_text,
+                _EQ80 + "\n" +
+                "DECAPSULATION PROCESS (Physical → Application)\n" +
+                _EQ80 + "\n\n"
+            )
             
             decapsulated_message = self._decapsulate_with_display(encapsulated_data)
             
             # Verification
-            self.encap_text.insert(tk.END, "\n" + "="*80 + "\n")
-            self.encap_text.insert(tk.END, "VERIFICATION\n")
-            self.encap_text.insert(tk.END, "="*80 + "\n")
-            self.encap_text.insert(tk.END, f"Original Message: {message}\n")
-            self.encap_text.insert(tk.END, f"Decapsulated Message: {decapsulated_message}\n")
-            self.encap_text.insert(tk.END, f"Match: {message == decapsulated_message}\n")
-            
-            # Draw visualization
-            self.draw_visualization()
-            
-            self.status_label.config(text="Simulation complete!")
+            self._post_text(
+                self.encap_text,
+                "\n" + _EQ80 + "\n" +
+                "VERIFICATION\n" +
+                _EQ80 + "\n" +
+                f"Original Message: {message}\n" +
+                f"Decapsulated Message: {decapsulated_message}\n" +
+                f"Match: {message == decapsulated_message}\n"
+            )
             
         except Exception as e:
-            messagebox.showerror("Error", f"Simulation error: {str(e)}")
-            self.status_label.config(text="Error occurred!")
+            self._fail_simulation(e)
+            return
+        
+        self._post(self._finish_simulation, "Simulation complete!")
+    
+    def _fail_simulation(self, error):
+        """Report a simulation error and re-enable the button"""
+        self._post(messagebox.showerror, "Error", f"Simulation error: {str(error)}")
+        self._post(self._finish_simulation, "Error occurred!")
+    
+    def _finish_simulation(self, status):
+        """Report the simulation result and re-enable the button (main thread)"""
+        self.status_label.config(text=status)
+        self.simulate_btn.config(state=tk.NORMAL)
+    
+    def _post(self, callback, *args):
+        """Queue a widget update to be run on the main thread"""
+        self._output_queue.put((callback, args))
+    
+    def _post_text(self, widget, text):
+        """Queue text to be appended to a text widget on the main thread"""
+        self._post(self._append_text, widget, text)
+    
+    def _poll_output(self):
+        """Apply queued widget updates, then check again shortly (main thread)"""
+        while True:
+            try:
+                callback, args = self._output_queue.get_nowait()
+            except queue.Empty:
+                break
+            callback(*args)
+        
+        self.root.after(OUTPUT_POLL_INTERVAL, self._poll_output)
+    
+    def _append_text(self, widget, text):
+        """Append text to a text widget and scroll to it (main thread)"""
+        widget.insert(tk.END, text)
+        
+        # Trim only the oldest lines once the retention limit is exceeded
+        line_count = int(widget.index("end-1c").split(".")[0])
+        if line_count > MAX_OUTPUT_LINES:
+            widget.delete("1.0", f"{line_count - MAX_OUTPUT_LINES + 1}.0")
         
-        finally:
-            self.simulate_btn.config(state=tk.NORMAL)
+        widget.see(tk.END)
+    
+    def _start_new_run(self):
+        """Append a separator below any output from the previous run"""
+        for widget in (self.encap_text, self.decap_text):
+            if widget.index("end-1c") != "1.0":
+                self._append_text(widget, "\n" + _HASH80 + "\n\n")
     
     def _encapsulate_with_display(self, message):
         """Encapsulate and display each layer"""
@@ -197,118 +292,122 @@ class OSISimulatorGUI:
     
     def _display_layer_encapsulation(self, layer, data):
         """Display layer information during encapsulation"""
-        self.encap_text.insert(tk.END, f"Layer {layer.layer_number}: {layer.layer_name}\n")
-        self.encap_text.insert(tk.END, "-" * 80 + "\n")
+        lines = [
+            f"Layer {layer.layer_number}: {layer.layer_name}\n",
+            _DASH80 + "\n"
+        ]
         
         if layer.layer_number == 7:  # Application
-            self.encap_text.insert(tk.END, f"Protocol: MQTT\n")
-            self.encap_text.insert(tk.END, f"MQTT Packet Type: {data['mqtt_packet']['fixed_header']['packet_type']}\n")
-            self.encap_text.insert(tk.END, f"QoS Level: {data['mqtt_packet']['fixed_header']['qos']}\n")
-            self.encap_text.insert(tk.END, f"Topic: {data['mqtt_packet']['variable_header']['topic']}\n")
-            self.encap_text.insert(tk.END, f"Packet ID: {data['mqtt_packet']['variable_header']['packet_id']}\n")
-            self.encap_text.insert(tk.END, f"Message: {data['data']}\n")
-            self.encap_text.insert(tk.END, f"\n→ Added MQTT headers (packet type, QoS, topic, packet ID)\n")
+            lines.append(f"Protocol: MQTT\n")
+            lines.append(f"MQTT Packet Type: {data['mqtt_packet']['fixed_header']['packet_type']}\n")
+            lines.append(f"QoS Level: {data['mqtt_packet']['fixed_header']['qos']}\n")
+            lines.append(f"Topic: {data['mqtt_packet']['variable_header']['topic']}\n")
+            lines.append(f"Packet ID: {data['mqtt_packet']['variable_header']['packet_id']}\n")
+            lines.append(f"Message: {data['data']}\n")
+            lines.append(f"\n→ Added MQTT headers (packet type, QoS, topic, packet ID)\n")
         
         elif layer.layer_number == 6:  # Presentation
-            self.encap_text.insert(tk.END, f"Encoding: {data['encoding']}\n")
-            self.encap_text.insert(tk.END, f"Encryption: {data['encryption']}\n")
-            self.encap_text.insert(tk.END, f"Encrypted data length: {len(data['encrypted_data'])} bytes\n")
-            self.encap_text.insert(tk.END, f"All encrypted data (hex): {data['encrypted_data'].hex()}\n")
-            self.encap_text.insert(tk.END, f"\n→ Encoded to UTF-8 and encrypted with XOR cipher\n")
+            lines.append(f"Encoding: {data['encoding']}\n")
+            lines.append(f"Encryption: {data['encryption']}\n")
+            lines.append(f"Encrypted data length: {len(data['encrypted_data'])} bytes\n")
+            lines.append(f"All encrypted data (hex): {hex_preview(data['encrypted_data'])}\n")
+            lines.append(f"\n→ Encoded to UTF-8 and encrypted with XOR cipher\n")
         
         elif layer.layer_number == 5:  # Session
-            self.encap_text.insert(tk.END, f"Session ID: {data['session_id']}\n")
-            self.encap_text.insert(tk.END, f"\n→ Added session ID for connection management\n")
+            lines.append(f"Session ID: {data['session_id']}\n")
+            lines.append(f"\n→ Added session ID for connection management\n")
         
         elif layer.layer_number == 4:  # Transport
-            self.encap_text.insert(tk.END, f"Total Segments: {data['total_segments']}\n")
-            self.encap_text.insert(tk.END, f"Segment Size: 10 bytes\n")
-            self.encap_text.insert(tk.END, f"Source Port: {data['segments'][0]['src_port']}\n")
-            self.encap_text.insert(tk.END, f"Destination Port: {data['segments'][0]['dst_port']}\n")
-            self.encap_text.insert(tk.END, f"All Segments:\n")
+            lines.append(f"Total Segments: {data['total_segments']}\n")
+            lines.append(f"Segment Size: 10 bytes\n")
+            lines.append(f"Source Port: {data['segments'][0]['src_port']}\n")
+            lines.append(f"Destination Port: {data['segments'][0]['dst_port']}\n")
+            lines.append(f"All Segments:\n")
             for i, segment in enumerate(data['segments']):
-                self.encap_text.insert(tk.END, f"  Segment {i}: seq={segment['sequence']}, checksum={segment['checksum']}, data(hex)={segment['data'].hex()}\n")
-            self.encap_text.insert(tk.END, f"\n→ Split data into {data['total_segments']} segments with ports and checksums\n")
+                lines.append(f"  Segment {i}: seq={segment['sequence']}, checksum={segment['checksum']}, data(hex)={hex_preview(segment['data'])}\n")
+            lines.append(f"\n→ Split data into {data['total_segments']} segments with ports and checksums\n")
         
         elif layer.layer_number == 3:  # Network
-            self.encap_text.insert(tk.END, f"Total Packets: {data['total_packets']}\n")
-            self.encap_text.insert(tk.END, f"Source IP: {data['packets'][0]['src_ip']}\n")
-            self.encap_text.insert(tk.END, f"Destination IP: {data['packets'][0]['dst_ip']}\n")
-            self.encap_text.insert(tk.END, f"TTL: {data['packets'][0]['ttl']}\n")
-            self.encap_text.insert(tk.END, f"Protocol: {data['packets'][0]['protocol']}\n")
-            self.encap_text.insert(tk.END, f"\n→ Added IP addresses and routing information to each segment\n")
+            lines.append(f"Total Packets: {data['total_packets']}\n")
+            lines.append(f"Source IP: {data['packets'][0]['src_ip']}\n")
+            lines.append(f"Destination IP: {data['packets'][0]['dst_ip']}\n")
+            lines.append(f"TTL: {data['packets'][0]['ttl']}\n")
+            lines.append(f"Protocol: {data['packets'][0]['protocol']}\n")
+            lines.append(f"\n→ Added IP addresses and routing information to each segment\n")
         
         elif layer.layer_number == 2:  # Data Link
-            self.encap_text.insert(tk.END, f"Total Frames: {data['total_frames']}\n")
-            self.encap_text.insert(tk.END, f"Source MAC: {data['frames'][0]['src_mac']}\n")
-            self.encap_text.insert(tk.END, f"Destination MAC: {data['frames'][0]['dst_mac']}\n")
-            self.encap_text.insert(tk.END, f"EtherType: {data['frames'][0]['ethertype']}\n")
-            self.encap_text.insert(tk.END, f"\n→ Added MAC addresses and frame check sequence to each packet\n")
+            lines.append(f"Total Frames: {data['total_frames']}\n")
+            lines.append(f"Source MAC: {data['frames'][0]['src_mac']}\n")
+            lines.append(f"Destination MAC: {data['frames'][0]['dst_mac']}\n")
+            lines.append(f"EtherType: {data['frames'][0]['ethertype']}\n")
+            lines.append(f"\n→ Added MAC addresses and frame check sequence to each packet\n")
         
         elif layer.layer_number == 1:  # Physical
-            self.encap_text.insert(tk.END, f"Total Bits: {data['total_bits']}\n")
-            self.encap_text.insert(tk.END, f"Total Binary Frames: {len(data['binary_frames'])}\n")
-            self.encap_text.insert(tk.END, f"All Binary Frames:\n")
+            lines.append(f"Total Bits: {data['total_bits']}\n")
+            lines.append(f"Total Binary Frames: {len(data['binary_frames'])}\n")
+            lines.append(f"All Binary Frames:\n")
             for i, frame in enumerate(data['binary_frames']):
-                self.encap_text.insert(tk.END, f"  Frame {i}: {frame['bit_length']} bits, binary={frame['binary_data']}\n")
-            self.encap_text.insert(tk.END, f"\n→ Converted frames to binary representation for transmission\n")
+                lines.append(f"  Frame {i}: {frame['bit_length']} bits, binary={frame['binary_data']}\n")
+            lines.append(f"\n→ Converted frames to binary representation for transmission\n")
+        
+        lines.append("\n")
         
-        self.encap_text.insert(tk.END, "\n")
-        self.encap_text.see(tk.END)
-        self.root.update()
+        # Hand the whole layer block to the main thread in one insert
+        self._post_text(self.encap_text, "".join(lines))
     
     def _display_layer_decapsulation(self, layer, data):
         """Display layer information during decapsulation"""
-        self.decap_text.insert(tk.END, f"Layer {layer.layer_number}: {layer.layer_name}\n")
-        self.decap_text.insert(tk.END, "-" * 80 + "\n")
+        lines = [
+            f"Layer {layer.layer_number}: {layer.layer_name}\n",
+            _DASH80 + "\n"
+        ]
         
         if layer.layer_number == 7:  # Application
-            self.decap_text.insert(tk.END, f"Protocol: MQTT\n")
-            self.decap_text.insert(tk.END, f"Extracted Message: {data}\n")
-            self.decap_text.insert(tk.END, f"\n→ Removed MQTT headers, retrieved original payload\n")
+            lines.append(f"Protocol: MQTT\n")
+            lines.append(f"Extracted Message: {data}\n")
+            lines.append(f"\n→ Removed MQTT headers, retrieved original payload\n")
         elif layer.layer_number == 6:  # Presentation
-            self.decap_text.insert(tk.END, "Decrypted and decoded data\n")
-            self.decap_text.insert(tk.END, f"MQTT Packet Type: {data['mqtt_packet']['fixed_header']['packet_type']}\n")
-            self.decap_text.insert(tk.END, f"Topic: {data['mqtt_packet']['variable_header']['topic']}\n")
-            self.decap_text.insert(tk.END, f"Payload: {data['data']}\n")
-            self.decap_text.insert(tk.END, f"\n→ Decrypted using XOR cipher and decoded from UTF-8\n")
+            lines.append("Decrypted and decoded data\n")
+            lines.append(f"MQTT Packet Type: {data['mqtt_packet']['fixed_header']['packet_type']}\n")
+            lines.append(f"Topic: {data['mqtt_packet']['variable_header']['topic']}\n")
+            lines.append(f"Payload: {data['data']}\n")
+            lines.append(f"\n→ Decrypted using XOR cipher and decoded from UTF-8\n")
         elif layer.layer_number == 5:  # Session
-            self.decap_text.insert(tk.END, "Session ID extracted and validated\n")
-            self.decap_text.insert(tk.END, "Data passed to Presentation Layer\n")
-            self.decap_text.insert(tk.END, f"\n→ Removed session information, validated connection\n")
+            lines.append("Session ID extracted and validated\n")
+            lines.append("Data passed to Presentation Layer\n")
+            lines.append(f"\n→ Removed session information, validated connection\n")
         elif layer.layer_number == 4:  # Transport
-            self.decap_text.insert(tk.END, "All Segments being reassembled:\n")
+            lines.append("All Segments being reassembled:\n")
             segments = data.get('segments', [])
             for segment in segments:
-                self.decap_text.insert(tk.END, f"  Segment {segment['sequence']}: checksum={segment['checksum']}, data(hex)={segment['data'].hex()}\n")
-            self.decap_text.insert(tk.END, "Checksums verified\n")
-            self.decap_text.insert(tk.END, f"Total data reassembled: {len(data['data']['encrypted_data'])} bytes\n")
-            self.decap_text.insert(tk.END, f"Reassembled data (hex): {data['data']['encrypted_data'].hex()}\n")
-            self.decap_text.insert(tk.END, f"\n→ Reassembled segments, verified checksums, removed port information\n")
+                lines.append(f"  Segment {segment['sequence']}: checksum={segment['checksum']}, data(hex)={hex_preview(segment['data'])}\n")
+            lines.append("Checksums verified\n")
+            lines.append(f"Total data reassembled: {len(data['data']['encrypted_data'])} bytes\n")
+            lines.append(f"Reassembled data (hex): {hex_preview(data['data']['encrypted_data'])}\n")
+            lines.append(f"\n→ Reassembled segments, verified checksums, removed port information\n")
         elif layer.layer_number == 3:  # Network
-            self.decap_text.insert(tk.END, f"Segments extracted: {len(data['segments'])} segments\n")
-            self.decap_text.insert(tk.END, "Segments extracted from packets\n")
-            self.decap_text.insert(tk.END, f"\n→ Removed IP headers, extracted transport layer segments\n")
+            lines.append(f"Segments extracted: {len(data['segments'])} segments\n")
+            lines.append("Segments extracted from packets\n")
+            lines.append(f"\n→ Removed IP headers, extracted transport layer segments\n")
         elif layer.layer_number == 2:  # Data Link
-            self.decap_text.insert(tk.END, f"Packets extracted: {len(data['packets'])} packets\n")
-            self.decap_text.insert(tk.END, "Packets extracted from frames\n")
-            self.decap_text.insert(tk.END, f"\n→ Removed MAC addresses and frame headers, extracted network packets\n")
+            lines.append(f"Packets extracted: {len(data['packets'])} packets\n")
+            lines.append("Packets extracted from frames\n")
+            lines.append(f"\n→ Removed MAC addresses and frame headers, extracted network packets\n")
         elif layer.layer_number == 1:  # Physical
-            self.decap_text.insert(tk.END, "All Binary Frames being converted:\n")
+            lines.append("All Binary Frames being converted:\n")
             for i, binary_frame in enumerate(data.get('binary_frames', [])):
-                self.decap_text.insert(tk.END, f"  Frame {i}: {binary_frame['bit_length']} bits, binary={binary_frame['binary_data']}\n")
-            self.decap_text.insert(tk.END, f"Frames converted: {len(data['frames'])} frames\n")
-            self.decap_text.insert(tk.END, "Frames reconstructed from binary data\n")
-            self.decap_text.insert(tk.END, f"\n→ Converted binary signals back to frames\n")
-        
-        self.decap_text.insert(tk.END, "\n")
-        self.decap_text.see(tk.END)
-        self.root.update()
-    
-    def draw_visualization(self):
-        """Draw OSI layer visualization"""
-        self.viz_canvas.delete("all")
+                lines.append(f"  Frame {i}: {binary_frame['bit_length']} bits, binary={binary_frame['binary_data']}\n")
+            lines.append(f"Frames converted: {len(data['frames'])} frames\n")
+            lines.append("Frames reconstructed from binary data\n")
+            lines.append(f"\n→ Converted binary signals back to frames\n")
+        
+        lines.append("\n")
         
+        # Hand the whole layer block to the main thread in one insert
+        self._post_text(self.decap_text, "".join(lines))
+    
+    def _build_static_viz(self):
+        """Draw OSI layer visualization (once, items are kept in self._viz_items)"""
         # Layer colors
         colors = [
             "#e74c3c",  # Application - Red
@@ -397,7 +496,8 @@ class OSISimulatorGUI:
             20,
             text="DECAPSULATION ↑",
             font=("Arial", 14, "bold"),
-            fill="#2c3e50"
+            fill="#2c3e50",
+            tags="viz_decap"
         )
         
         for i, (name, color) in enumerate(reversed(list(zip(layer_names, colors)))):
@@ -411,7 +511,8 @@ class OSISimulatorGUI:
                 y + layer_height,
                 fill=color,
                 outline="#2c3e50",
-                width=2
+                width=2,
+                tags="viz_decap"
             )
             
             # Draw text
@@ -420,7 +521,8 @@ class OSISimulatorGUI:
                 y + layer_height // 2,
                 text=name,
                 font=("Arial", 12, "bold"),
-                fill="white"
+                fill="white",
+                tags="viz_decap"
             )
             
             # Draw arrow (upward)
@@ -433,14 +535,15 @@ class OSISimulatorGUI:
                     arrow_y - 5,
                     arrow=tk.LAST,
                     width=3,
-                    fill="#2c3e50"
+                    fill="#2c3e50",
+                    tags="viz_decap"
                 )
         
         # Draw transmission arrow in the middle
         mid_x = (encap_x + layer_width + decap_x) // 2
         bottom_y = start_y + 6 * (layer_height + 10) + layer_height
         
-        self.viz_canvas.create_line(
+        transmission_line = self.viz_canvas.create_line(
             encap_x + layer_width + 20,
             bottom_y,
             decap_x - 20,
@@ -450,19 +553,45 @@ class OSISimulatorGUI:
             fill="#e74c3c"
         )
         
-        self.viz_canvas.create_text(
+        transmission_text = self.viz_canvas.create_text(
             mid_x,
             bottom_y - 15,
             text="TRANSMISSION",
             font=("Arial", 12, "bold"),
             fill="#e74c3c"
         )
+        
+        self._viz_items = {
+            "decap_x": decap_x,
+            "transmission_line": transmission_line,
+            "transmission_text": transmission_text
+        }
+    
+    def _relayout_viz(self, event):
+        """Move the decapsulation side to follow the canvas width"""
+        decap_x = event.width - 400
+        dx = decap_x - self._viz_items["decap_x"]
+        if not dx:
+            return
+        
+        self.viz_canvas.move("viz_decap", dx, 0)
+        
+        # Stretch the transmission arrow and recenter its label
+        line = self._viz_items["transmission_line"]
+        start_x, y, end_x, _ = self.viz_canvas.coords(line)
+        self.viz_canvas.coords(line, start_x, y, end_x + dx, y)
+        self.viz_canvas.coords(
+            self._viz_items["transmission_text"],
+            (start_x - 20 + decap_x) // 2,
+            y - 15
+        )
+        
+        self._viz_items["decap_x"] = decap_x
     
     def clear_output(self):
         """Clear all output"""
         self.encap_text.delete(1.0, tk.END)
         self.decap_text.delete(1.0, tk.END)
-        self.viz_canvas.delete("all")
         self.status_label.config(text="Ready")
 
 